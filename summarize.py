@@ -6,15 +6,25 @@ Summarizes transcript files using OpenAI-compatible API (supports local models).
 """
 
 import argparse
+import asyncio
+import contextlib
+import functools
 import json
+import mmap
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 try:
-    from openai import OpenAI
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        AsyncOpenAI,
+        InternalServerError,
+        RateLimitError,
+    )
 except ImportError:
     print("Error: openai package not installed. Install with: pip install openai", file=sys.stderr)
     sys.exit(1)
@@ -25,6 +35,51 @@ except ImportError:
     print("Error: python-dotenv package not installed. Install with: pip install python-dotenv", file=sys.stderr)
     sys.exit(1)
 
+try:
+    from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+except ImportError:
+    print("Error: tenacity package not installed. Install with: pip install tenacity", file=sys.stderr)
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Per-request API timeout in seconds (local models can be slow on long transcripts)
+API_TIMEOUT = 600.0
+
+# Chunked summarization: overlap between consecutive chunks, and the
+# characters-per-token estimate used when tiktoken is not installed
+CHUNK_OVERLAP_TOKENS = 200
+CHARS_PER_TOKEN = 4
+
+# Transcript formats, ordered from cheapest to most expensive to parse
+TRANSCRIPT_FORMAT_PRIORITY = {'.txt': 0, '.vtt': 1, '.srt': 2, '.json': 3}
+
+# Precompiled patterns used when stripping timestamps from transcripts
+# VTT: WEBVTT header, timestamp lines, cue numbers and cue timing lines
+_VTT_SKIP = re.compile(r'^(?:WEBVTT|\d{2}:\d{2}:\d{2}|\d+$)|-->')
+# SRT: sequence numbers, timestamp lines and cue timing lines
+_SRT_SKIP = re.compile(r'^(?:\d+$|\d{2}:\d{2}:\d{2})|-->')
+_VTT_TAG = re.compile(r'<[^>]+>')
+
+
+class SummarizationError(Exception):
+    """Raised when the API fails to produce a summary."""
+
+
+def _loads(data: str):
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def load_system_prompt(prompt_file: Path) -> str:
     """Load system prompt from file."""
@@ -36,50 +91,43 @@ def load_system_prompt(prompt_file: Path) -> str:
         return f.read().strip()
 
 
+def _iter_file_lines(file_path: Path) -> Iterator[str]:
+    """Yield decoded lines from a memory-mapped file without reading it into one string."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                yield line.decode('utf-8')
+
+
+def _iter_caption_text(lines: Iterable[str], skip: re.Pattern) -> Iterator[str]:
+    """Yield caption text from VTT/SRT lines, dropping lines matched by skip and formatting tags."""
+    stripped = filter(None, (line.strip() for line in lines))
+    return filter(None, (_VTT_TAG.sub('', line) for line in stripped if not skip.search(line)))
+
+
 def parse_transcript_file(file_path: Path) -> str:
     """Parse transcript file and extract text content."""
-    content = file_path.read_text(encoding='utf-8')
-    
     # Handle different formats
-    if file_path.suffix == '.txt':
-        # Plain text - return as is
-        return content.strip()
-    
-    elif file_path.suffix == '.vtt':
+    if file_path.suffix == '.vtt':
         # WebVTT format - extract text
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            # Skip WEBVTT header, timestamps, and empty lines
-            if (line and 
-                not line.startswith('WEBVTT') and 
-                not re.match(r'^\d{2}:\d{2}:\d{2}', line) and
-                not '-->' in line and
-                not line.isdigit()):
-                # Remove VTT formatting tags
-                line = re.sub(r'<[^>]+>', '', line)
-                if line:
-                    lines.append(line)
-        return '\n'.join(lines)
+        return '\n'.join(_iter_caption_text(_iter_file_lines(file_path), _VTT_SKIP))
     
     elif file_path.suffix == '.srt':
         # SRT format - extract text
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            # Skip timestamps and sequence numbers
-            if (line and 
-                not re.match(r'^\d+$', line) and
-                not re.match(r'^\d{2}:\d{2}:\d{2}', line) and
-                not '-->' in line):
-                if line:
-                    lines.append(line)
-        return '\n'.join(lines)
+        return '\n'.join(_iter_caption_text(_iter_file_lines(file_path), _SRT_SKIP))
+    
+    content = file_path.read_text(encoding='utf-8')
+    
+    if file_path.suffix == '.txt':
+        # Plain text - return as is
+        return content.strip()
     
     elif file_path.suffix == '.json':
         # JSON format - extract text from segments
         try:
-            data = json.loads(content)
+            data = _loads(content)
             if isinstance(data, list):
                 # List of segments
                 texts = [seg.get('text', '') for seg in data if isinstance(seg, dict)]
@@ -95,23 +143,30 @@ def parse_transcript_file(file_path: Path) -> str:
 
 
 def list_transcript_files(output_dir: Path) -> list[Path]:
-    """List all transcript files in output directory."""
-    transcript_extensions = ['.txt', '.vtt', '.srt', '.json']
-    files = []
+    """List all transcript files in output directory.
     
-    for ext in transcript_extensions:
-        files.extend(output_dir.glob(f'*{ext}'))
+    When a transcript exists in several formats, the cheapest one to parse is
+    listed: .txt, then .vtt, then .srt, then .json.
+    """
+    if not output_dir.is_dir():
+        return []
+    
+    # Single directory scan instead of one glob per extension
+    with os.scandir(output_dir) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1] in TRANSCRIPT_FORMAT_PRIORITY and entry.is_file()
+        ]
     
     # Remove duplicates (same base name, different extensions)
-    seen = set()
-    unique_files = []
-    for f in sorted(files):
-        base = f.stem
-        if base not in seen:
-            seen.add(base)
-            unique_files.append(f)
+    files_by_stem = {}
+    for f in files:
+        current = files_by_stem.get(f.stem)
+        if current is None or TRANSCRIPT_FORMAT_PRIORITY[f.suffix] < TRANSCRIPT_FORMAT_PRIORITY[current.suffix]:
+            files_by_stem[f.stem] = f
     
-    return unique_files
+    return sorted(files_by_stem.values())
 
 
 def select_transcript_file(output_dir: Path) -> Optional[Path]:
@@ -145,40 +200,374 @@ def select_transcript_file(output_dir: Path) -> Optional[Path]:
             return None
 
 
-def summarize_transcript(
+@functools.lru_cache(maxsize=8)
+def _get_client(base_url: Optional[str], api_key: Optional[str]) -> AsyncOpenAI:
+    """Return a shared API client so connections are pooled across requests."""
+    return AsyncOpenAI(
+        api_key=api_key or "not-needed",  # Not needed for local models
+        base_url=base_url,
+        timeout=API_TIMEOUT,
+        max_retries=0  # Retries are handled by _create_completion
+    )
+
+
+def _log_retry(retry_state):
+    """Report a transient API error before waiting to retry."""
+    print(
+        f"API request failed ({retry_state.outcome.exception()}), "
+        f"retrying (attempt {retry_state.attempt_number + 1})...",
+        file=sys.stderr
+    )
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, max=30),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)),
+    before_sleep=_log_retry,
+    reraise=True
+)
+async def _create_completion(client: AsyncOpenAI, **kwargs):
+    """Create a chat completion, backing off exponentially on transient errors."""
+    return await client.chat.completions.create(**kwargs)
+
+
+async def summarize_transcript(
     transcript_text: str,
     system_prompt: str,
     base_url: Optional[str] = None,
     api_key: Optional[str] = None,
     model: str = "gpt-3.5-turbo",
-    max_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None,
+    prompt: str = "Please summarize the following transcript:",
+    semaphore: Optional[asyncio.Semaphore] = None
 ) -> str:
-    """Summarize transcript using OpenAI API."""
-    client = OpenAI(
-        api_key=api_key or "not-needed",  # Not needed for local models
-        base_url=base_url
-    )
+    """Summarize transcript using OpenAI API.
     
-    print(f"Summarizing using model: {model}")
-    if base_url:
-        print(f"Using base URL: {base_url}")
+    If a semaphore is given, the API request is made while holding it.
+    """
+    client = _get_client(base_url, api_key)
     
     try:
-        response = client.chat.completions.create(
+        async with semaphore or contextlib.nullcontext():
+            response = await _create_completion(
+                client,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": f"{prompt}\n\n{transcript_text}"}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.7
+            )
+        
+        return response.choices[0].message.content.strip()
+    
+    except Exception as e:
+        raise SummarizationError(f"Error calling API: {e}") from e
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Return the tiktoken encoding for a model, or None if it cannot be loaded."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown (e.g. local) model - approximate with a common encoding
+        pass
+    except Exception:
+        # Encoding files could not be loaded (e.g. offline)
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encoding files could not be loaded (e.g. offline)
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count tokens in text, approximating from its length without tiktoken."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text))
+
+
+def split_transcript(
+    transcript_text: str,
+    model: str,
+    chunk_tokens: int,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS
+) -> list[str]:
+    """Split transcript into overlapping chunks of at most chunk_tokens tokens.
+    
+    The overlap is capped at a quarter of the chunk size so small chunk sizes
+    still make progress through the transcript.
+    """
+    if chunk_tokens < 1:
+        raise ValueError("chunk_tokens must be at least 1")
+    overlap_tokens = min(overlap_tokens, chunk_tokens // 4)
+    encoding = _get_encoding(model)
+    if encoding is None:
+        # Split on characters, approximating the token sizes
+        units = transcript_text
+        size = chunk_tokens * CHARS_PER_TOKEN
+        overlap = overlap_tokens * CHARS_PER_TOKEN
+    else:
+        units = encoding.encode(transcript_text)
+        size = chunk_tokens
+        overlap = overlap_tokens
+    step = size - overlap
+    
+    chunks = []
+    for start in range(0, len(units), step):
+        window = units[start:start + size]
+        chunks.append(window if encoding is None else encoding.decode(window))
+        if start + size >= len(units):
+            break
+    
+    return chunks
+
+
+async def summarize_transcript_chunked(
+    transcript_text: str,
+    system_prompt: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model: str = "gpt-3.5-turbo",
+    max_tokens: Optional[int] = None,
+    chunk_tokens: Optional[int] = None,
+    max_concurrency: int = 4,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> str:
+    """Summarize a long transcript by summarizing chunks and then combining them.
+    
+    Transcripts that fit in chunk_tokens (or when chunk_tokens is None) are
+    summarized with a single request. API requests are limited by semaphore,
+    or by a new Semaphore(max_concurrency) if none is shared in.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+    
+    if chunk_tokens is None or count_tokens(transcript_text, model) <= chunk_tokens:
+        return await summarize_transcript(
+            transcript_text=transcript_text,
+            system_prompt=system_prompt,
+            base_url=base_url,
+            api_key=api_key,
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"Please summarize the following transcript:\n\n{transcript_text}"}
-            ],
             max_tokens=max_tokens,
-            temperature=0.7
+            semaphore=semaphore
         )
+    
+    chunks = split_transcript(transcript_text, model, chunk_tokens)
+    print(f"Transcript exceeds {chunk_tokens} tokens, summarizing in {len(chunks)} chunks")
+    
+    async def summarize_chunk(index: int, chunk: str) -> str:
+        return await summarize_transcript(
+            transcript_text=chunk,
+            system_prompt=system_prompt,
+            base_url=base_url,
+            api_key=api_key,
+            model=model,
+            max_tokens=max_tokens,
+            prompt=f"Please summarize the following part ({index + 1} of {len(chunks)}) of a transcript:",
+            semaphore=semaphore
+        )
+    
+    partial_summaries = await asyncio.gather(*[summarize_chunk(i, c) for i, c in enumerate(chunks)])
+    combined = "\n\n".join(f"### Part {i + 1}\n{summary}" for i, summary in enumerate(partial_summaries))
+    
+    return await summarize_transcript(
+        transcript_text=combined,
+        system_prompt=system_prompt,
+        base_url=base_url,
+        api_key=api_key,
+        model=model,
+        max_tokens=max_tokens,
+        prompt="The following are summaries of consecutive parts of one transcript. "
+               "Please combine them into a single summary of the whole transcript:",
+        semaphore=semaphore
+    )
+
+
+async def summarize_transcripts_batched(
+    transcripts: list[str],
+    system_prompt: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model: str = "gpt-3.5-turbo",
+    max_tokens: Optional[int] = None,
+    semaphore: Optional[asyncio.Semaphore] = None
+) -> list[str]:
+    """Summarize several transcripts in a single API call.
+    
+    Transcripts are concatenated under numbered headings and the model is asked
+    to reply with a JSON object holding one summary per transcript id. Ids the
+    model leaves out or gets wrong come back as empty strings. If a semaphore
+    is given, the API request is made while holding it.
+    """
+    client = _get_client(base_url, api_key)
+    
+    user_content = "\n\n".join(f"### Transcript {i}\n{t}" for i, t in enumerate(transcripts))
+    instructions = (
+        f"Please summarize each of the following {len(transcripts)} transcripts separately. "
+        'Respond with a JSON object of the form {"summaries": [{"id": 0, "summary": "..."}, ...]} '
+        "containing exactly one entry per transcript, where id is the transcript number."
+    )
+    
+    try:
+        async with semaphore or contextlib.nullcontext():
+            response = await _create_completion(
+                client,
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": f"{instructions}\n\n{user_content}"}
+                ],
+                max_tokens=max_tokens,
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
         
-        return response.choices[0].message.content.strip()
+        entries = _loads(response.choices[0].message.content)["summaries"]
     
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise SummarizationError(f"Error parsing batched API response: {e}") from e
     except Exception as e:
-        print(f"Error calling API: {e}", file=sys.stderr)
-        sys.exit(1)
+        raise SummarizationError(f"Error calling API: {e}") from e
+    
+    # Map summaries back to their transcripts by id; missing entries stay empty
+    summaries = [""] * len(transcripts)
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            index = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= index < len(transcripts):
+            summaries[index] = str(entry.get("summary", "")).strip()
+    
+    return summaries
+
+
+async def summarize_batch(
+    files: list[Path],
+    system_prompt: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    model: str = "gpt-3.5-turbo",
+    max_tokens: Optional[int] = None,
+    max_concurrency: int = 4,
+    group_size: int = 1,
+    chunk_tokens: Optional[int] = None,
+    on_summary: Optional[Callable[[Path, str], None]] = None
+) -> list[tuple[Path, str]]:
+    """Summarize multiple transcript files concurrently.
+    
+    With group_size > 1, that many transcripts are packed into each API call.
+    Transcripts longer than chunk_tokens are always summarized on their own,
+    in chunks. on_summary is called with each summary as soon as it is ready,
+    so a failing file does not hold back the others. Returns (file, error)
+    pairs for the files that could not be summarized. At most max_concurrency
+    API requests are in flight at once, including those for chunks.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    failures = []
+    
+    transcripts = []
+    for file_path in files:
+        try:
+            transcript_text = parse_transcript_file(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            failures.append((file_path, f"Error reading transcript: {e}"))
+            continue
+        if not transcript_text:
+            print(f"Skipping empty transcript: {file_path.name}", file=sys.stderr)
+            continue
+        transcripts.append((file_path, transcript_text))
+    
+    group_size = max(1, group_size)
+    groups = []
+    current_group = []
+    for item in transcripts:
+        if chunk_tokens is not None and count_tokens(item[1], model) > chunk_tokens:
+            groups.append([item])
+            continue
+        current_group.append(item)
+        if len(current_group) == group_size:
+            groups.append(current_group)
+            current_group = []
+    if current_group:
+        groups.append(current_group)
+    
+    async def bounded(group: list[tuple[Path, str]]):
+        for file_path, transcript_text in group:
+            print(f"Summarizing: {file_path.name} ({len(transcript_text)} characters)")
+        try:
+            if len(group) == 1:
+                summaries = [await summarize_transcript_chunked(
+                    transcript_text=group[0][1],
+                    system_prompt=system_prompt,
+                    base_url=base_url,
+                    api_key=api_key,
+                    model=model,
+                    max_tokens=max_tokens,
+                    chunk_tokens=chunk_tokens,
+                    semaphore=semaphore
+                )]
+            else:
+                summaries = await summarize_transcripts_batched(
+                    transcripts=[text for _, text in group],
+                    system_prompt=system_prompt,
+                    base_url=base_url,
+                    api_key=api_key,
+                    model=model,
+                    max_tokens=max_tokens,
+                    semaphore=semaphore
+                )
+        except SummarizationError as e:
+            failures.extend((file_path, str(e)) for file_path, _ in group)
+            return
+        
+        for index, (file_path, transcript_text) in enumerate(group):
+            if not summaries[index]:
+                # The model left this transcript out of the batched response
+                print(
+                    f"Warning: no summary for {file_path.name} in batched response, "
+                    "summarizing it separately",
+                    file=sys.stderr
+                )
+                try:
+                    summaries[index] = await summarize_transcript(
+                        transcript_text=transcript_text,
+                        system_prompt=system_prompt,
+                        base_url=base_url,
+                        api_key=api_key,
+                        model=model,
+                        max_tokens=max_tokens,
+                        semaphore=semaphore
+                    )
+                except SummarizationError as e:
+                    failures.append((file_path, str(e)))
+                    continue
+            if on_summary is not None:
+                on_summary(file_path, summaries[index])
+    
+    await asyncio.gather(*[bounded(g) for g in groups])
+    return failures
+
+
+def print_summary(summary: str, title: str = "SUMMARY"):
+    """Print a summary framed by separator lines."""
+    print("\n" + "="*80)
+    print(title)
+    print("="*80)
+    print(summary)
+    print("="*80)
 
 
 def main():
@@ -222,11 +611,40 @@ def main():
     )
     parser.add_argument(
         "-o", "--output",
-        help="Output file for summary (default: print to stdout)"
+        help="Output file for summary, or output directory in --batch mode (default: print to stdout)"
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        help="Summarize transcripts longer than this many tokens in overlapping chunks, "
+             "then combine the partial summaries (default: send the whole transcript)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Summarize all transcript files in the output directory concurrently"
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent API requests in --batch mode and for --chunk-tokens chunks (default: 4)"
+    )
+    parser.add_argument(
+        "--group-size",
+        type=int,
+        default=1,
+        help="Number of transcripts to pack into each API request in --batch mode; "
+             "4-16 works well for many short transcripts (default: 1)"
     )
     
     args = parser.parse_args()
     
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+    if args.chunk_tokens is not None and args.chunk_tokens < 1:
+        parser.error("--chunk-tokens must be at least 1")
+    
     # Load environment variables from .env file
     env_file = Path(".env")
     if env_file.exists():
@@ -237,6 +655,53 @@ def main():
     api_key = args.api_key or os.getenv("OPENAI_API_KEY")
     base_url = args.base_url or os.getenv("OPENAI_BASE_URL")
     
+    # Load system prompt
+    system_prompt = load_system_prompt(args.system_prompt)
+    
+    print(f"Summarizing using model: {args.model}")
+    if base_url:
+        print(f"Using base URL: {base_url}")
+    
+    if args.batch:
+        files = list_transcript_files(args.output_dir)
+        if not files:
+            print(f"No transcript files found in {args.output_dir}")
+            sys.exit(0)
+        
+        if args.output:
+            summary_dir = Path(args.output)
+            summary_dir.mkdir(parents=True, exist_ok=True)
+        
+        def output_summary(file_path: Path, summary: str):
+            """Write or print one summary as soon as it is ready."""
+            if args.output:
+                output_path = summary_dir / f"{file_path.stem}.md"
+                output_path.write_text(summary, encoding='utf-8')
+                print(f"Summary saved to: {output_path}")
+            else:
+                print_summary(summary, f"SUMMARY: {file_path.name}")
+        
+        print(f"\nProcessing {len(files)} files (max concurrency: {args.max_concurrency})")
+        failures = asyncio.run(summarize_batch(
+            files=files,
+            system_prompt=system_prompt,
+            base_url=base_url,
+            api_key=api_key,
+            model=args.model,
+            max_tokens=args.max_tokens,
+            max_concurrency=args.max_concurrency,
+            group_size=args.group_size,
+            chunk_tokens=args.chunk_tokens,
+            on_summary=output_summary
+        ))
+        
+        if failures:
+            print(f"\nFailed to summarize {len(failures)} of {len(files)} files:", file=sys.stderr)
+            for file_path, error in failures:
+                print(f"  {file_path.name}: {error}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
     # Determine which file to process
     if args.file:
         transcript_file = Path(args.file)
@@ -252,9 +717,6 @@ def main():
     
     print(f"\nProcessing: {transcript_file.name}")
     
-    # Load system prompt
-    system_prompt = load_system_prompt(args.system_prompt)
-    
     # Parse transcript
     print("Reading transcript...")
     transcript_text = parse_transcript_file(transcript_file)
@@ -266,14 +728,20 @@ def main():
     print(f"Transcript length: {len(transcript_text)} characters")
     
     # Summarize
-    summary = summarize_transcript(
-        transcript_text=transcript_text,
-        system_prompt=system_prompt,
-        base_url=base_url,
-        api_key=api_key,
-        model=args.model,
-        max_tokens=args.max_tokens
-    )
+    try:
+        summary = asyncio.run(summarize_transcript_chunked(
+            transcript_text=transcript_text,
+            system_prompt=system_prompt,
+            base_url=base_url,
+            api_key=api_key,
+            model=args.model,
+            max_tokens=args.max_tokens,
+            chunk_tokens=args.chunk_tokens,
+            max_concurrency=args.max_concurrency
+        ))
+    except SummarizationError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
     
     # Output summary
     if args.output:
@@ -281,11 +749,7 @@ def main():
         output_path.write_text(summary, encoding='utf-8')
         print(f"\nSummary saved to: {output_path}")
     else:
-        print("\n" + "="*80)
-        print("SUMMARY")
-        print("="*80)
-        print(summary)
-        print("="*80)
+        print_summary(summary)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transcribe import parse_vtt
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class ParseVttTest(unittest.TestCase):
+    def test_rolling_auto_captions_are_collapsed(self):
+        segments = parse_vtt(FIXTURES / "youtube_auto_captions.vtt")
+
+        self.assertEqual(
+            [segment["text"] for segment in segments],
+            ["hello everyone", "welcome to the show", "today we talk about parsing"]
+        )
+        self.assertEqual(
+            [(segment["start"], segment["end"]) for segment in segments],
+            [
+                ("00:00:00.000", "00:00:02.500"),
+                ("00:00:02.510", "00:00:05.000"),
+                ("00:00:05.010", "00:00:07.000")
+            ]
+        )
+
+    def test_multi_line_cues_are_kept(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vtt_file = Path(temp_dir) / "captions.vtt"
+            vtt_file.write_text(
+                "WEBVTT\n\n"
+                "00:00:01.000 --> 00:00:03.000 line:90%\n"
+                "<v Alice>First line\n"
+                "second line\n\n"
+                "00:00:03.000 --> 00:00:04.000\n"
+                "Third line\n",
+                encoding="utf-8"
+            )
+            segments = parse_vtt(vtt_file)
+
+        self.assertEqual(
+            [segment["text"] for segment in segments],
+            ["First line\nsecond line", "Third line"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,36 +2,101 @@
 """
 YouTube Video Transcription Script
 
-Downloads audio from YouTube videos and transcribes them using local Whisper model.
+Downloads audio from YouTube videos and transcribes them using a local Whisper model
+(via faster-whisper).
 Falls back to YouTube's built-in transcripts if available.
 """
 
 import argparse
+import asyncio
 import json
+import mmap
 import os
 import re
-import subprocess
+import socket
+import socketserver
+import stat
 import sys
 import tempfile
+import textwrap
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def run_command(cmd: list[str], check: bool = True) -> Tuple[int, str, str]:
-    """Run a shell command and return exit code, stdout, and stderr."""
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=check
-        )
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        return e.returncode, e.stdout, e.stderr
+if TYPE_CHECKING:
+    import numpy as np
+    from faster_whisper import WhisperModel
+
+# Whisper model used for transcription, from tiny (fastest) to large (most accurate)
+WHISPER_MODEL = "base"
+
+# faster-whisper expects 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# Audio is transcribed in chunks of at most this many seconds to bound memory
+# use. Each chunk ends at the quietest point in its last CHUNK_SEARCH_SECONDS so
+# cuts fall between words.
+CHUNK_SECONDS = 300
+CHUNK_SEARCH_SECONDS = 30
+
+# Detected language confidence needed before it is reused for later chunks
+LANGUAGE_PROBABILITY_THRESHOLD = 0.8
+
+# YouTube auto-captions repeat each line in near-zero-length cues (~10 ms) that
+# only keep the previous line on screen; cues this short are dropped
+MIN_CUE_SECONDS = 0.05
+
+# Where a `--serve` transcription server listens by default: the per-user
+# runtime directory, or a per-user name in the shared temp directory
+if os.environ.get("XDG_RUNTIME_DIR"):
+    DEFAULT_SOCKET_PATH = Path(os.environ["XDG_RUNTIME_DIR"]) / "yt-transcribe-whisper.sock"
+elif hasattr(os, "getuid"):
+    DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / f"yt-transcribe-whisper-{os.getuid()}.sock"
+else:
+    # No Unix domain sockets (e.g. Windows), so --serve is unavailable anyway
+    DEFAULT_SOCKET_PATH = Path(tempfile.gettempdir()) / "yt-transcribe-whisper.sock"
+
+# Precompiled patterns used in parsing loops
+_VID_ID = re.compile(r'[?&]v=([a-zA-Z0-9_-]{11})')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_TIMESTAMP = re.compile(r'\d{2}:\d{2}:\d{2}')
+# Cue timing line, optionally followed by cue settings (e.g. "align:start position:0%")
+_VTT_TIMING = re.compile(rb'(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})(?:[ \t]|$)')
+_VTT_TAG = re.compile(r'<[^>]+>')
+
+
+class AudioDownloadError(Exception):
+    """Raised when a video's audio cannot be downloaded or decoded."""
 
 
-def get_video_info(url: str) -> Tuple[str, str]:
+def _dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+async def run_command(cmd: list[str], capture_stdout: bool = True) -> Tuple[int, str]:
+    """Run a command asynchronously and return exit code and stdout.
+    
+    stderr is passed straight through to the terminal so progress and errors
+    appear as they happen instead of being buffered until the command exits.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else None,
+        stderr=None
+    )
+    stdout, _ = await process.communicate()
+    return process.returncode, stdout.decode('utf-8', errors='replace') if stdout else ""
+
+
+async def get_video_info(url: str) -> Tuple[str, str]:
     """Get video title and ID from YouTube URL."""
     cmd = [
         "yt-dlp",
@@ -40,7 +105,7 @@ def get_video_info(url: str) -> Tuple[str, str]:
         url
     ]
     
-    exit_code, stdout, stderr = run_command(cmd, check=False)
+    exit_code, stdout = await run_command(cmd)
     
     if exit_code == 0 and stdout.strip():
         lines = stdout.strip().split('\n')
@@ -50,7 +115,7 @@ def get_video_info(url: str) -> Tuple[str, str]:
         elif len(lines) == 1:
             # Sometimes title and ID are on same line or only one is returned
             # Try to extract ID from URL
-            video_id_match = re.search(r'[?&]v=([a-zA-Z0-9_-]{11})', url)
+            video_id_match = _VID_ID.search(url)
             video_id = video_id_match.group(1) if video_id_match else "unknown"
             title = lines[0].strip()
         else:
@@ -58,25 +123,27 @@ def get_video_info(url: str) -> Tuple[str, str]:
             video_id = "unknown"
     else:
         # Fallback: extract ID from URL
-        video_id_match = re.search(r'[?&]v=([a-zA-Z0-9_-]{11})', url)
+        video_id_match = _VID_ID.search(url)
         video_id = video_id_match.group(1) if video_id_match else "unknown"
         title = "unknown"
     
     # Sanitize title for filename
-    title = re.sub(r'[<>:"/\\|?*]', '_', title)
+    title = _UNSAFE_FILENAME_CHARS.sub('_', title)
     title = title[:100]  # Limit length
     
     return title, video_id
 
 
-def check_youtube_transcript(url: str, temp_dir: Path) -> Optional[Path]:
+async def check_youtube_transcript(url: str, temp_dir: Path) -> Optional[Path]:
     """Check if YouTube has built-in transcripts available."""
     print("Checking for YouTube transcripts...")
-    vtt_file = temp_dir / "transcript.vtt"
     
+    # Request manual and auto-generated English subtitles in one invocation;
+    # yt-dlp prefers the manual track when both exist
     cmd = [
         "yt-dlp",
         "--write-subs",
+        "--write-auto-subs",
         "--sub-format", "vtt",
         "--skip-download",
         "--sub-lang", "en",
@@ -84,7 +151,7 @@ def check_youtube_transcript(url: str, temp_dir: Path) -> Optional[Path]:
         url
     ]
     
-    exit_code, stdout, stderr = run_command(cmd, check=False)
+    exit_code, _ = await run_command(cmd, capture_stdout=False)
     
     if exit_code == 0:
         # Find the actual VTT file that was created
@@ -95,60 +162,60 @@ def check_youtube_transcript(url: str, temp_dir: Path) -> Optional[Path]:
             with open(vtt_path, 'r', encoding='utf-8') as f:
                 content = f.read().strip()
                 # Check if there's actual transcript content (not just WEBVTT header)
-                if len(content) > 10 and re.search(r'\d{2}:\d{2}:\d{2}', content):
+                if len(content) > 10 and _TIMESTAMP.search(content):
                     print(f"Found YouTube transcript: {vtt_path}")
                     return vtt_path
     
-    # Try without language restriction
-    cmd = [
-        "yt-dlp",
-        "--write-auto-subs",
-        "--sub-format", "vtt",
-        "--skip-download",
-        "-o", str(temp_dir / "transcript"),
-        url
-    ]
-    
-    exit_code, stdout, stderr = run_command(cmd, check=False)
-    
-    if exit_code == 0:
-        vtt_files = list(temp_dir.glob("*.vtt"))
-        if vtt_files:
-            vtt_path = vtt_files[0]
-            # Check if file has actual content
-            with open(vtt_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if len(content) > 10 and re.search(r'\d{2}:\d{2}:\d{2}', content):
-                    print(f"Found YouTube auto-generated transcript: {vtt_path}")
-                    return vtt_path
-    
     print("No YouTube transcripts found, will download audio for transcription")
     return None
 
 
 def parse_vtt(vtt_file: Path) -> list[dict]:
-    """Parse VTT file and extract text with timestamps."""
-    segments = []
-    with open(vtt_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+    """Parse VTT file and extract text with timestamps.
     
-    # VTT format: timestamp lines followed by text
-    pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3}) --> (\d{2}:\d{2}:\d{2}\.\d{3})\n(.*?)(?=\n\n|\n\d{2}:|$)'
-    matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
+    Rolling YouTube auto-captions are collapsed so each spoken line appears once.
+    """
+    segments = []
     
-    for match in matches:
-        start_time = match.group(1)
-        end_time = match.group(2)
-        text = match.group(3).strip()
+    def add_segment(start_time: bytes, end_time: bytes, text_lines: list[bytes]):
+        start, end = start_time.decode('ascii'), end_time.decode('ascii')
+        if time_to_seconds(end) - time_to_seconds(start) < MIN_CUE_SECONDS:
+            return
         # Remove VTT formatting tags
-        text = re.sub(r'<[^>]+>', '', text)
-        if text:
+        lines = [
+            stripped for stripped in (
+                _VTT_TAG.sub('', line.decode('utf-8')).strip() for line in text_lines
+            ) if stripped
+        ]
+        # A rolling cue repeats the previous cue's last line above the new one
+        if len(lines) > 1 and segments and lines[0] == segments[-1]['text'].rsplit('\n', 1)[-1]:
+            lines = lines[1:]
+        if lines:
             segments.append({
-                'start': start_time,
-                'end': end_time,
-                'text': text
+                'start': start,
+                'end': end,
+                'text': '\n'.join(lines)
             })
     
+    with open(vtt_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return segments
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # Single pass over lines: a timing line opens a cue, whose text runs
+            # until the next blank line or timing line
+            cue = None
+            for line in iter(content.readline, b''):
+                line = line.rstrip(b'\r\n')
+                timing = _VTT_TIMING.match(line)
+                if timing or not line:
+                    if cue:
+                        add_segment(*cue)
+                    cue = (timing.group(1), timing.group(2), []) if timing else None
+                elif cue:
+                    cue[2].append(line)
+            if cue:
+                add_segment(*cue)
+    
     return segments
 
 
@@ -161,6 +228,14 @@ def time_to_seconds(time_str: str) -> float:
     return hours * 3600 + minutes * 60 + seconds
 
 
+def vtt_to_srt_time(time_str: str) -> str:
+    """Convert VTT time format (HH:MM:SS.mmm) to SRT time format (HH:MM:SS,mmm)."""
+    # Fixed-width timestamps only differ in the millisecond separator
+    if len(time_str) == 12 and time_str[8] == '.':
+        return f"{time_str[:8]},{time_str[9:]}"
+    return seconds_to_srt_time(time_to_seconds(time_str))
+
+
 def seconds_to_srt_time(seconds: float) -> str:
     """Convert seconds to SRT time format."""
     hours = int(seconds // 3600)
@@ -170,89 +245,351 @@ def seconds_to_srt_time(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
-def save_txt(segments: list[dict], output_file: Path):
-    """Save transcript as plain text."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for seg in segments:
-            f.write(seg['text'] + '\n')
+def save_transcripts(segments: list[dict], output_base: Path, formats: set[str]) -> list[Path]:
+    """Save transcript in all requested formats in a single pass over segments."""
+    ordered_formats = [fmt for fmt in ("vtt", "txt", "srt", "json") if fmt in formats]
+    output_files = [output_base.with_suffix(f'.{fmt}') for fmt in ordered_formats]
+    
+    with ExitStack() as stack:
+        handles = {
+            fmt: stack.enter_context(open(output_file, 'w', encoding='utf-8'))
+            for fmt, output_file in zip(ordered_formats, output_files)
+        }
+        vtt_f = handles.get("vtt")
+        txt_f = handles.get("txt")
+        srt_f = handles.get("srt")
+        json_f = handles.get("json")
+        
+        if vtt_f:
+            vtt_f.write("WEBVTT\n\n")
+        if json_f:
+            json_f.write("[")
+        
+        for i, seg in enumerate(segments, 1):
+            text = seg['text']
+            if vtt_f:
+                vtt_f.write(f"{seg['start']} --> {seg['end']}\n{text}\n\n")
+            if txt_f:
+                # Plain text intentionally omits timestamps
+                txt_f.write(text + '\n')
+            if srt_f:
+                srt_f.write(f"{i}\n{vtt_to_srt_time(seg['start'])} --> {vtt_to_srt_time(seg['end'])}\n{text}\n\n")
+            if json_f:
+                # Stream the array one element at a time, matching json.dump(indent=2)
+                json_f.write("\n" if i == 1 else ",\n")
+                json_f.write(textwrap.indent(_dumps(seg), "  "))
+        
+        if json_f:
+            json_f.write("\n]" if segments else "]")
+    
+    return output_files
 
 
-def save_vtt(segments: list[dict], output_file: Path):
-    """Save transcript as WebVTT format."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write("WEBVTT\n\n")
-        for seg in segments:
-            f.write(f"{seg['start']} --> {seg['end']}\n")
-            f.write(f"{seg['text']}\n\n")
+async def stream_audio(url: str, quiet: bool = False) -> "np.ndarray":
+    """Stream audio from YouTube through ffmpeg into memory as 16 kHz mono int16 samples.
+    
+    Raises AudioDownloadError on failure. With quiet, yt-dlp shows no progress
+    and its error output goes into the exception instead of the terminal.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise AudioDownloadError("Error: numpy not installed. Install with: pip install faster-whisper")
+    
+    # yt-dlp writes the raw audio stream to a pipe that ffmpeg decodes directly,
+    # so no intermediate WAV file is written to disk
+    ytdlp = ffmpeg = None
+    read_fd, write_fd = os.pipe()
+    try:
+        try:
+            ytdlp = await asyncio.create_subprocess_exec(
+                "yt-dlp",
+                *(["--quiet", "--no-progress"] if quiet else []),
+                "-f", "bestaudio/best",
+                "-o", "-",
+                url,
+                stdout=write_fd,
+                # Otherwise show download progress as it happens
+                stderr=asyncio.subprocess.PIPE if quiet else None
+            )
+            ffmpeg = await asyncio.create_subprocess_exec(
+                "ffmpeg",
+                "-loglevel", "error",
+                "-i", "pipe:0",
+                "-f", "s16le",
+                "-ac", "1",
+                "-ar", str(SAMPLE_RATE),
+                "pipe:1",
+                stdin=read_fd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        finally:
+            # The child processes hold their own copies of the pipe ends
+            os.close(read_fd)
+            os.close(write_fd)
+        
+        (_, ytdlp_stderr), (pcm, ffmpeg_stderr) = await asyncio.gather(
+            ytdlp.communicate(),
+            ffmpeg.communicate()
+        )
+    except (OSError, asyncio.CancelledError) as e:
+        # A tool is missing (e.g. ffmpeg is not installed) or a speculative
+        # download is no longer needed; stop the child processes
+        for process in (ytdlp, ffmpeg):
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+        if isinstance(e, OSError):
+            raise AudioDownloadError(f"Error downloading audio: {e}") from e
+        raise
+    
+    # Report both tools: when ffmpeg fails to decode, yt-dlp also dies writing
+    # to the closed pipe, so its exit code alone would hide the real cause
+    errors = []
+    if ytdlp.returncode != 0:
+        message = f"Error downloading audio: yt-dlp exited with code {ytdlp.returncode}"
+        if ytdlp_stderr:
+            message += f"\n{ytdlp_stderr.decode('utf-8', errors='replace').rstrip()}"
+        errors.append(message)
+    if ffmpeg.returncode != 0 or not pcm:
+        errors.append(f"Error decoding audio: {ffmpeg_stderr.decode('utf-8', errors='replace').rstrip()}")
+    if errors:
+        raise AudioDownloadError("\n".join(errors))
+    
+    # Kept as int16 (half the size of float32); converted per chunk when transcribing
+    return np.frombuffer(pcm, np.int16)
 
 
-def save_srt(segments: list[dict], output_file: Path):
-    """Save transcript as SRT format."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        for i, seg in enumerate(segments, 1):
-            start_sec = time_to_seconds(seg['start'])
-            end_sec = time_to_seconds(seg['end'])
-            f.write(f"{i}\n")
-            f.write(f"{seconds_to_srt_time(start_sec)} --> {seconds_to_srt_time(end_sec)}\n")
-            f.write(f"{seg['text']}\n\n")
+async def download_audio(url: str, audio_task: Optional[asyncio.Task] = None) -> "np.ndarray":
+    """Download a video's audio, exiting with an error message on failure.
+    
+    audio_task, if given, is an already running quiet stream_audio task for url.
+    """
+    print("Downloading audio...")
+    try:
+        if audio_task is not None:
+            return await audio_task
+        return await stream_audio(url)
+    except AudioDownloadError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
 
 
-def save_json(segments: list[dict], output_file: Path):
-    """Save transcript as JSON format."""
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(segments, f, indent=2, ensure_ascii=False)
+def load_whisper_model(model_name: str = WHISPER_MODEL) -> "WhisperModel":
+    """Load a faster-whisper model with INT8 quantized weights."""
+    try:
+        import ctranslate2
+        from faster_whisper import WhisperModel
+    except ImportError:
+        print("Error: faster-whisper not installed. Install with: pip install faster-whisper", file=sys.stderr)
+        sys.exit(1)
+    
+    # INT8 weights (with FP16 activations on GPU) via CTranslate2
+    compute_type = "int8_float16" if ctranslate2.get_cuda_device_count() > 0 else "int8"
+    return WhisperModel(model_name, device="auto", compute_type=compute_type)
 
 
-def download_audio(url: str, temp_dir: Path) -> Path:
-    """Download audio from YouTube video."""
-    print("Downloading audio...")
-    audio_file = temp_dir / "audio.wav"
+def _find_chunk_end(audio: "np.ndarray", start: int) -> int:
+    """Return where the chunk starting at start should end, preferring a quiet spot."""
+    end = start + CHUNK_SECONDS * SAMPLE_RATE
+    if end >= len(audio):
+        return len(audio)
     
-    cmd = [
-        "yt-dlp",
-        "-x",
-        "--audio-format", "wav",
-        "-o", str(audio_file),
-        url
-    ]
+    import numpy as np
     
-    exit_code, stdout, stderr = run_command(cmd)
-    if exit_code != 0:
-        print(f"Error downloading audio: {stderr}", file=sys.stderr)
-        sys.exit(1)
+    # Energy of 100 ms frames over the search window; cut in the quietest one
+    frame = SAMPLE_RATE // 10
+    search_start = end - CHUNK_SEARCH_SECONDS * SAMPLE_RATE
+    window = audio[search_start:end].astype(np.int32)
+    energy = np.abs(window).reshape(-1, frame).sum(axis=1)
+    return search_start + int(energy.argmin()) * frame + frame // 2
+
+
+def transcribe_audio(audio: "np.ndarray", model: Optional["WhisperModel"] = None) -> list[dict]:
+    """Transcribe 16 kHz mono int16 audio samples using faster-whisper."""
+    print("Transcribing audio with Whisper...")
+    
+    if model is None:
+        model = load_whisper_model()
     
-    # yt-dlp might add extension, find the actual file
-    audio_files = list(temp_dir.glob("*.wav"))
-    if audio_files:
-        return audio_files[0]
+    language = None
+    segments = []
+    offset = 0
+    while offset < len(audio):
+        end = _find_chunk_end(audio, offset)
+        # Only one chunk is held as float32 at a time, so peak memory does not
+        # grow with video length
+        chunk = audio[offset:end].astype("float32") / 32768.0
+        offset_seconds = offset / SAMPLE_RATE
+        offset = end
+        result_segments, info = model.transcribe(
+            chunk,
+            beam_size=5,
+            language=language,
+            condition_on_previous_text=False
+        )
+        # Keep the detected language for later chunks once detection is
+        # confident; a chunk of silence or music can be misdetected
+        if language is None and info.language_probability >= LANGUAGE_PROBABILITY_THRESHOLD:
+            language = info.language
+        
+        # faster-whisper yields segments lazily; transcription runs while iterating
+        for seg in result_segments:
+            segments.append({
+                'start': seconds_to_vtt_time(offset_seconds + seg.start),
+                'end': seconds_to_vtt_time(offset_seconds + seg.end),
+                'text': seg.text.strip()
+            })
     
-    return audio_file
+    return segments
 
 
-def transcribe_audio(audio_file: Path) -> list[dict]:
-    """Transcribe audio using Whisper."""
-    print("Transcribing audio with Whisper...")
+async def transcribe_via_server(url: str, socket_path: Path) -> Optional[list[dict]]:
+    """Ask a running transcription server for segments; None if no server is reachable."""
+    if not socket_path.exists():
+        return None
+    if not _is_own_socket(socket_path):
+        print(f"Warning: ignoring {socket_path}, it is not a socket owned by you", file=sys.stderr)
+        return None
     
     try:
-        import whisper
-    except ImportError:
-        print("Error: openai-whisper not installed. Install with: pip install openai-whisper", file=sys.stderr)
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return None
+    
+    print(f"Transcribing audio via server at {socket_path}...")
+    try:
+        writer.write(json.dumps({"url": url}).encode('utf-8') + b"\n")
+        await writer.drain()
+        # The server closes the connection after sending its response
+        data = await reader.read()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    
+    try:
+        response = json.loads(data)
+    except json.JSONDecodeError:
+        print("Error: transcription server closed the connection without a valid reply", file=sys.stderr)
         sys.exit(1)
     
-    model = whisper.load_model("base")
-    result = model.transcribe(str(audio_file))
+    if "error" in response:
+        print(f"Error from transcription server: {response['error']}", file=sys.stderr)
+        sys.exit(1)
     
-    segments = []
-    for seg in result["segments"]:
-        segments.append({
-            'start': seconds_to_vtt_time(seg['start']),
-            'end': seconds_to_vtt_time(seg['end']),
-            'text': seg['text'].strip()
-        })
+    return response["segments"]
+
+
+async def transcribe_url(
+    url: str,
+    socket_path: Path,
+    audio_task: Optional[asyncio.Task] = None
+) -> list[dict]:
+    """Transcribe a video's audio, preferring a running server with the model loaded.
     
+    audio_task, if given, is an already running quiet stream_audio task for url.
+    """
+    segments = await transcribe_via_server(url, socket_path)
+    if segments is None:
+        audio = await download_audio(url, audio_task)
+        segments = transcribe_audio(audio)
     return segments
 
 
+async def discard_task(task: asyncio.Task):
+    """Cancel a background task that is no longer needed and wait for it to finish.
+    
+    Whatever the task returned or raised is discarded.
+    """
+    task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception):
+        pass
+
+
+class TranscriptionRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON transcription request using the server's loaded model."""
+    
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            url = request["url"]
+            print(f"\nRequest: {url}")
+            audio = asyncio.run(stream_audio(url))
+            response = {"segments": transcribe_audio(audio, self.server.model)}
+            print(f"Transcribed {len(response['segments'])} segments")
+        except AudioDownloadError as e:
+            print(e, file=sys.stderr)
+            response = {"error": str(e)}
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            response = {"error": f"invalid request: {e}"}
+        except Exception as e:
+            print(f"Error: transcription failed: {e}", file=sys.stderr)
+            response = {"error": f"transcription failed: {e}"}
+        try:
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+        except OSError:
+            # The client went away before the response was ready
+            pass
+
+
+def _is_own_socket(socket_path: Path) -> bool:
+    """Check that a path is a Unix socket owned by the current user.
+    
+    Other local users can create files in a shared directory, so their sockets
+    are neither sent requests nor replaced.
+    """
+    try:
+        info = socket_path.stat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == os.getuid()
+
+
+def _socket_is_live(socket_path: Path) -> bool:
+    """Check whether something is accepting connections on a Unix socket."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: Path, model_name: str = WHISPER_MODEL):
+    """Run a transcription server that keeps the Whisper model loaded between requests."""
+    if not hasattr(socketserver, "UnixStreamServer"):
+        print("Error: --serve requires Unix domain socket support", file=sys.stderr)
+        sys.exit(1)
+    
+    if socket_path.exists():
+        if not _is_own_socket(socket_path):
+            print(f"Error: {socket_path} exists and is not a socket owned by you", file=sys.stderr)
+            sys.exit(1)
+        if _socket_is_live(socket_path):
+            print(f"Error: a server is already listening on {socket_path}", file=sys.stderr)
+            sys.exit(1)
+        # Remove a stale socket left behind by a previous server
+        socket_path.unlink()
+    
+    print(f"Loading Whisper model: {model_name}")
+    model = load_whisper_model(model_name)
+    
+    with socketserver.UnixStreamServer(str(socket_path), TranscriptionRequestHandler) as server:
+        # Only the current user may send requests
+        os.chmod(socket_path, 0o600)
+        server.model = model
+        print(f"Listening on {socket_path} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopping server.")
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
 def seconds_to_vtt_time(seconds: float) -> str:
     """Convert seconds to VTT time format."""
     hours = int(seconds // 3600)
@@ -262,12 +599,68 @@ def seconds_to_vtt_time(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
 
+async def process_video(url: str, output: str, formats_to_save: set[str], socket_path: Path):
+    """Fetch or transcribe a video's transcript and save it in the requested formats."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        # Start downloading audio while captions are checked, so videos without
+        # captions don't wait for the check first. A running transcription server
+        # downloads the audio itself, so there is nothing to speculate on then.
+        audio_task = None
+        if not _is_own_socket(socket_path):
+            audio_task = asyncio.create_task(stream_audio(url, quiet=True))
+        
+        try:
+            # Video info and the transcript check only need the URL, so run them together
+            print("Getting video information...")
+            (video_title, video_id), vtt_file = await asyncio.gather(
+                get_video_info(url),
+                check_youtube_transcript(url, temp_path)
+            )
+            print(f"Video: {video_title} ({video_id})")
+            
+            segments = parse_vtt(vtt_file) if vtt_file else []
+            if segments:
+                print(f"Extracted {len(segments)} segments from YouTube transcript")
+            else:
+                if vtt_file:
+                    print("YouTube transcript is empty, falling back to audio transcription...")
+                # Download audio and transcribe
+                segments = await transcribe_url(url, socket_path, audio_task)
+                print(f"Transcribed {len(segments)} segments")
+        finally:
+            if audio_task is not None:
+                await discard_task(audio_task)
+        
+        # Create output directory
+        output_dir = Path("output")
+        output_dir.mkdir(exist_ok=True)
+        
+        # Generate output filename with video title and ID
+        if output == "transcript":
+            # Use video title and ID for default filename
+            output_filename = f"{video_title}_{video_id}"
+        else:
+            output_filename = output
+        
+        # Save in requested formats
+        output_base = output_dir / output_filename
+        print(f"\nSaving transcripts to {output_dir}/")
+        
+        for output_file in save_transcripts(segments, output_base, formats_to_save):
+            print(f"  Saved: {output_file}")
+        
+        print("Done!")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download and transcribe YouTube videos"
     )
     parser.add_argument(
         "url",
+        nargs="?",
         help="YouTube video URL"
     )
     parser.add_argument(
@@ -286,13 +679,25 @@ def main():
         action="store_true",
         help="Enable plain text (.txt) output without timestamps (for post-processing). Equivalent to -f txt."
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a transcription server that keeps the Whisper model loaded between requests"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET_PATH,
+        help=f"Unix socket of the transcription server; used automatically when present (default: {DEFAULT_SOCKET_PATH})"
+    )
     
     args = parser.parse_args()
     
-    # Get video info for filename
-    print("Getting video information...")
-    video_title, video_id = get_video_info(args.url)
-    print(f"Video: {video_title} ({video_id})")
+    if args.serve:
+        serve(args.socket)
+        return
+    if not args.url:
+        parser.error("the following arguments are required: url")
     
     # Determine which formats to save
     formats_to_save = set()
@@ -309,60 +714,7 @@ def main():
     if args.txt:
         formats_to_save.add("txt")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Check for YouTube transcripts first
-        vtt_file = check_youtube_transcript(args.url, temp_path)
-        
-        if vtt_file:
-            segments = parse_vtt(vtt_file)
-            if len(segments) == 0:
-                print("YouTube transcript is empty, falling back to audio transcription...")
-                # Download audio and transcribe
-                audio_file = download_audio(args.url, temp_path)
-                segments = transcribe_audio(audio_file)
-                print(f"Transcribed {len(segments)} segments")
-            else:
-                print(f"Extracted {len(segments)} segments from YouTube transcript")
-        else:
-            # Download audio and transcribe
-            audio_file = download_audio(args.url, temp_path)
-            segments = transcribe_audio(audio_file)
-            print(f"Transcribed {len(segments)} segments")
-        
-        # Create output directory
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        
-        # Generate output filename with video title and ID
-        if args.output == "transcript":
-            # Use video title and ID for default filename
-            output_filename = f"{video_title}_{video_id}"
-        else:
-            output_filename = args.output
-        
-        # Save in requested formats
-        output_base = output_dir / output_filename
-        print(f"\nSaving transcripts to {output_dir}/")
-        
-        if "vtt" in formats_to_save:
-            save_vtt(segments, output_base.with_suffix('.vtt'))
-            print(f"  Saved: {output_base.with_suffix('.vtt')}")
-        
-        if "txt" in formats_to_save:
-            save_txt(segments, output_base.with_suffix('.txt'))
-            print(f"  Saved: {output_base.with_suffix('.txt')}")
-        
-        if "srt" in formats_to_save:
-            save_srt(segments, output_base.with_suffix('.srt'))
-            print(f"  Saved: {output_base.with_suffix('.srt')}")
-        
-        if "json" in formats_to_save:
-            save_json(segments, output_base.with_suffix('.json'))
-            print(f"  Saved: {output_base.with_suffix('.json')}")
-        
-        print("Done!")
+    asyncio.run(process_video(args.url, args.output, formats_to_save, args.socket))
 
 
 if __name__ == "__main__":